@@ -3,5 +3,7 @@
 from .evaluator import BLEUEvaluator
 from .data_loader import DataLoader
 from .matcher import DataMatcher
+from .top_k import TopKMiner
+from .pipeline import EvaluationPipeline
 
-__all__ = ["BLEUEvaluator", "DataLoader", "DataMatcher"]
\ No newline at end of file
+__all__ = ["BLEUEvaluator", "DataLoader", "DataMatcher", "TopKMiner", "EvaluationPipeline"]
\ No newline at end of file
@@ -1,9 +1,23 @@
 """CSV와 JSON 파일 로딩 기능"""
 
+import glob
 import json
+import os
 import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
+
+
+# 샤드 간 중복 이미지 ID 처리 정책
+DUPLICATE_POLICIES = ('error', 'first', 'last')
+
+# 샤드 디렉토리에서 읽어들일 파일 확장자
+SHARD_EXTENSIONS = ('.json', '.jsonl')
+
+# 샤드 읽기 스레드 기본값 (ThreadPoolExecutor 기본값과 동일)
+DEFAULT_READ_WORKERS = min(32, (os.cpu_count() or 1) + 4)
 
 
 class DataLoader:
@@ -46,21 +60,32 @@ class DataLoader:
         print(f"Loaded {len(df)} ground truth records from {csv_path}")
         return df
     
-    def load_predictions(self, json_path: str) -> Dict[str, Any]:
+    def load_predictions(self, json_path: str, max_workers: Optional[int] = None,
+                         duplicate_policy: str = 'error') -> Dict[str, Any]:
         """
-        Load model predictions from JSON file.
+        Load model predictions from a JSON file or from a directory/glob of shard files.
+        
+        A single file in the legacy JSON layout is loaded as is; JSONL files,
+        directories and glob patterns are read as shards.
         
         Args:
-            json_path: Path to the JSON file containing model predictions
+            json_path: Path to a JSON/JSONL file, a directory of shards, or a glob pattern
+            max_workers: Number of threads used to read shards (None uses DEFAULT_READ_WORKERS)
+            duplicate_policy: How to resolve duplicate image IDs across shards
+                ('error', 'first' or 'last')
             
         Returns:
             Dictionary with prediction data
             
         Raises:
-            FileNotFoundError: If JSON file doesn't exist
-            ValueError: If JSON format is invalid
+            FileNotFoundError: If JSON file doesn't exist or no shards match
+            ValueError: If JSON format is invalid or duplicates are found with 'error' policy
         """
         path = Path(json_path)
+        if path.is_dir() or (path.is_file() and path.suffix == '.jsonl') or \
+                (not path.exists() and glob.has_magic(json_path)):
+            return self._load_prediction_shards(json_path, max_workers, duplicate_policy)
+        
         if not path.exists():
             raise FileNotFoundError(f"Prediction file not found: {json_path}")
         
@@ -84,6 +109,181 @@ class DataLoader:
         print(f"Loaded predictions for {prediction_count} images from {json_path}")
         return data
     
+    def resolve_prediction_shards(self, shard_path: str) -> List[str]:
+        """
+        Resolve a shard file, directory or glob pattern into a sorted list of shard files.
+        
+        Args:
+            shard_path: Single shard file, directory containing shard files or a glob pattern
+            
+        Returns:
+            Sorted list of shard file paths
+            
+        Raises:
+            FileNotFoundError: If no shard files match
+        """
+        path = Path(shard_path)
+        if path.is_file():
+            return [shard_path]
+        if path.is_dir():
+            shard_files = [str(p) for p in path.iterdir()
+                           if p.is_file() and p.suffix in SHARD_EXTENSIONS]
+        else:
+            shard_files = [p for p in glob.glob(shard_path) if Path(p).is_file()]
+        
+        if not shard_files:
+            raise FileNotFoundError(f"No prediction shard files found: {shard_path}")
+        
+        # 중복 정책 'first'/'last'가 결정적이도록 정렬
+        return sorted(shard_files)
+    
+    def read_prediction_shard(self, shard_file: str) -> Tuple[List[Tuple[str, Any]], List[Any]]:
+        """
+        Read a single shard file in JSON or JSONL layout.
+        
+        Args:
+            shard_file: Path to the shard file
+            
+        Returns:
+            Tuple of ((image_path, entry) list, not_parsed list)
+            
+        Raises:
+            ValueError: If the shard format is invalid
+        """
+        entries: List[Tuple[str, Any]] = []
+        not_parsed: List[Any] = []
+        
+        try:
+            with open(shard_file, 'r', encoding='utf-8') as f:
+                if shard_file.endswith('.jsonl'):
+                    # JSONL: 한 줄에 {"image": "<경로>", "ocr": {...}} 레코드 하나
+                    for line_number, line in enumerate(f, 1):
+                        line = line.strip()
+                        if not line:
+                            continue
+                        record = json.loads(line)
+                        if not isinstance(record, dict) or 'image' not in record:
+                            raise ValueError(f"line {line_number} must be an object with an 'image' key")
+                        image_path = record['image']
+                        entries.append((image_path, {k: v for k, v in record.items() if k != 'image'}))
+                else:
+                    data = json.load(f)
+                    if not isinstance(data, dict) or 'images' not in data:
+                        raise ValueError("JSON shard must contain 'images' key")
+                    not_parsed = list(data.get('not_parsed') or [])
+                    for key, entry in data.items():
+                        if key in ('images', 'not_parsed'):
+                            continue
+                        entries.append((key, entry))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON format in shard {shard_file}: {e}")
+        except ValueError as e:
+            raise ValueError(f"Invalid shard {shard_file}: {e}")
+        except Exception as e:
+            raise ValueError(f"Failed to read shard {shard_file}: {e}")
+        
+        return entries, not_parsed
+    
+    def iter_prediction_shards(self, shard_files: List[str], max_workers: Optional[int] = None,
+                               read_fn: Optional[Callable[[str], Any]] = None
+                               ) -> Iterator[Tuple[str, Tuple[List[Tuple[str, Any]], List[Any]]]]:
+        """
+        Read shard files concurrently and yield them in shard order.
+        
+        At most max_workers shards are read ahead of the consumer, and pending
+        reads are cancelled as soon as the consumer stops (e.g. on an error).
+        
+        Args:
+            shard_files: Shard file paths in merge order
+            max_workers: Number of reader threads (None uses DEFAULT_READ_WORKERS)
+            read_fn: Function reading a single shard (defaults to read_prediction_shard)
+            
+        Yields:
+            Tuples of (shard_file, (entries, not_parsed))
+        """
+        workers = max_workers or DEFAULT_READ_WORKERS
+        read_fn = read_fn or self.read_prediction_shard
+        
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            remaining = iter(shard_files)
+            pending = deque()
+            for shard_file in remaining:
+                pending.append((shard_file, executor.submit(read_fn, shard_file)))
+                if len(pending) >= workers:
+                    break
+            
+            while pending:
+                shard_file, future = pending.popleft()
+                result = future.result()
+                next_file = next(remaining, None)
+                if next_file is not None:
+                    pending.append((next_file, executor.submit(read_fn, next_file)))
+                yield shard_file, result
+        finally:
+            # 오류나 조기 종료시 아직 시작하지 않은 읽기 취소
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _load_prediction_shards(self, shard_path: str, max_workers: Optional[int],
+                                duplicate_policy: str) -> Dict[str, Any]:
+        """
+        Read shard files concurrently and merge them into a single prediction index.
+        
+        Args:
+            shard_path: Directory containing shard files or a glob pattern
+            max_workers: Number of reader threads
+            duplicate_policy: How to resolve duplicate image IDs across shards
+            
+        Returns:
+            Dictionary with prediction data in the single-file JSON layout
+        """
+        if duplicate_policy not in DUPLICATE_POLICIES:
+            raise ValueError(f"Unknown duplicate policy: {duplicate_policy}. "
+                             f"Expected one of {list(DUPLICATE_POLICIES)}")
+        
+        shard_files = self.resolve_prediction_shards(shard_path)
+        
+        # 이미지 ID -> (이미지 경로, 항목, 샤드 파일)
+        index: Dict[str, Tuple[str, Any, str]] = {}
+        not_parsed: List[Any] = []
+        duplicate_count = 0
+        
+        # 스레드 풀로 샤드를 동시에 읽고, 결정적인 병합을 위해 샤드 순서대로 수집
+        shards = self.iter_prediction_shards(shard_files, max_workers)
+        try:
+            for shard_file, (entries, shard_not_parsed) in shards:
+                not_parsed.extend(shard_not_parsed)
+                
+                for image_path, entry in entries:
+                    # DataMatcher와 동일하게 파일명(확장자 제외)을 이미지 ID로 사용
+                    image_id = Path(image_path).stem
+                    
+                    if image_id in index:
+                        duplicate_count += 1
+                        if duplicate_policy == 'error':
+                            raise ValueError(
+                                f"Duplicate image ID '{image_id}' in {shard_file} "
+                                f"(already loaded from {index[image_id][2]})"
+                            )
+                        if duplicate_policy == 'first':
+                            continue
+                    
+                    index[image_id] = (image_path, entry, shard_file)
+        finally:
+            shards.close()
+        
+        data: Dict[str, Any] = {'images': [image_path for image_path, _, _ in index.values()]}
+        for image_path, entry, _ in index.values():
+            data[image_path] = entry
+        if not_parsed:
+            data['not_parsed'] = not_parsed
+        
+        self.prediction_data = data
+        print(f"Loaded predictions for {len(index)} images from {len(shard_files)} shards in {shard_path}")
+        if duplicate_count:
+            print(f"  Resolved {duplicate_count} duplicate image IDs (policy: {duplicate_policy})")
+        return data
+    
     def get_ground_truth_data(self) -> pd.DataFrame:
         """로드된 Ground Truth 데이터 얻기"""
         if self.ground_truth_data is None:
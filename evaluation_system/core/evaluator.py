@@ -4,6 +4,7 @@ import evaluate
 from typing import List, Tuple, Dict, Any, Optional
 import pandas as pd
 from ..utils.preprocessors import normalize_text
+from .top_k import TopKMiner
 
 
 class BLEUEvaluator:
@@ -12,6 +13,7 @@ class BLEUEvaluator:
     def __init__(self):
         self.bleu_metric = evaluate.load("bleu")
         self.results: List[Dict[str, Any]] = []
+        self.top_k_miner: Optional[TopKMiner] = None
     
     def calculate_bleu_score(self, prediction: str, reference: str) -> float:
         """
@@ -45,12 +47,17 @@ class BLEUEvaluator:
             print(f"Warning: BLEU calculation failed for texts. Error: {e}")
             return 0.0
     
-    def evaluate_pairs(self, matched_pairs: List[Tuple[str, str, str]]) -> Dict[str, Any]:
+    def evaluate_pairs(self, matched_pairs: List[Tuple[str, str, str]], top_k: int = 0,
+                       gt_df: Optional[pd.DataFrame] = None,
+                       ngram_order: int = 2) -> Dict[str, Any]:
         """
         Evaluate BLEU scores for all matched pairs.
         
         Args:
             matched_pairs: List of (image_id, ground_truth, prediction) tuples
+            top_k: Number of worst/best pairs to keep while scoring (0 disables)
+            gt_df: Ground truth DataFrame for per-domain_code top-k tracking
+            ngram_order: Highest n-gram order for top-k diffs
             
         Returns:
             Dictionary with evaluation results
@@ -59,6 +66,14 @@ class BLEUEvaluator:
         total_bleu = 0.0
         valid_scores = 0
         
+        # 요청시 스트리밍 top-k 추적기 준비
+        self.top_k_miner = TopKMiner(top_k, ngram_order=ngram_order) if top_k > 0 else None
+        domain_lookup = {}
+        if self.top_k_miner is not None and gt_df is not None and 'domain_code' in gt_df.columns:
+            for image_id, domain_code in zip(gt_df['new_custom_id'], gt_df['domain_code']):
+                if pd.notna(domain_code):
+                    domain_lookup[image_id] = str(domain_code)
+        
         print(f"Evaluating BLEU scores for {len(matched_pairs)} pairs...")
         
         for image_id, ground_truth, prediction in matched_pairs:
@@ -74,6 +89,10 @@ class BLEUEvaluator:
             self.results.append(result)
             total_bleu += bleu_score
             valid_scores += 1
+            
+            if self.top_k_miner is not None:
+                self.top_k_miner.add(image_id, ground_truth, prediction, bleu_score,
+                                     domain_code=domain_lookup.get(image_id))
         
         # 평균 BLEU 점수 계산
         avg_bleu = total_bleu / valid_scores if valid_scores > 0 else 0.0
@@ -85,6 +104,9 @@ class BLEUEvaluator:
             'results': self.results
         }
         
+        if self.top_k_miner is not None:
+            evaluation_summary['top_k'] = self.top_k_miner.get_report()
+        
         print(f"Evaluation complete:")
         print(f"  Average BLEU score: {avg_bleu:.4f}")
         print(f"  Total pairs evaluated: {len(matched_pairs)}")
@@ -95,6 +117,18 @@ class BLEUEvaluator:
         """모든 평가된 쌍에 대한 상세 결과 얻기"""
         return self.results
     
+    def export_top_k_json(self, output_path: str) -> None:
+        """
+        Export the worst/best top-k report to a JSON file.
+        
+        Args:
+            output_path: Path to save JSON file
+        """
+        if self.top_k_miner is None:
+            raise ValueError("No top-k report to export. Run evaluation with top_k > 0 first.")
+        
+        self.top_k_miner.export_json(output_path)
+    
     def export_results_csv(self, output_path: str, include_metadata: bool = False, 
                           gt_df: Optional[pd.DataFrame] = None) -> None:
         """
@@ -28,22 +28,16 @@ class DataMatcher:
         filename = Path(image_path).stem
         return filename
     
-    def match_data(self, gt_df: pd.DataFrame, pred_data: Dict) -> List[Tuple[str, str, str]]:
+    def build_gt_lookup(self, gt_df: pd.DataFrame) -> Dict[str, str]:
         """
-        Match ground truth and prediction data by image IDs.
+        Build an image ID to ground truth text lookup.
         
         Args:
             gt_df: DataFrame with ground truth data
-            pred_data: Dictionary with prediction data
             
         Returns:
-            List of tuples (image_id, ground_truth_text, prediction_text)
+            Dictionary mapping image IDs to combined question/answer text
         """
-        self.matched_pairs = []
-        self.unmatched_gt = set()
-        self.unmatched_pred = set()
-        
-        # 룩업 사전 생성
         gt_lookup = {}
         for _, row in gt_df.iterrows():
             image_id = row['new_custom_id']
@@ -66,20 +60,48 @@ class DataMatcher:
                 
             gt_lookup[image_id] = gt_text
         
+        return gt_lookup
+    
+    def extract_prediction_text(self, data: Dict) -> str:
+        """
+        Extract prediction text from a single prediction entry.
+        
+        Args:
+            data: Prediction entry like {"ocr": {"output": "..."}}
+            
+        Returns:
+            Full OCR output text, or empty string if missing
+        """
+        # OCR 출력에서 예측 텍스트 추출 (전체 텍스트)
+        if 'ocr' in data and 'output' in data['ocr']:
+            return str(data['ocr']['output']) if data['ocr']['output'] is not None else ""
+        return ""
+    
+    def match_data(self, gt_df: pd.DataFrame, pred_data: Dict) -> List[Tuple[str, str, str]]:
+        """
+        Match ground truth and prediction data by image IDs.
+        
+        Args:
+            gt_df: DataFrame with ground truth data
+            pred_data: Dictionary with prediction data
+            
+        Returns:
+            List of tuples (image_id, ground_truth_text, prediction_text)
+        """
+        self.matched_pairs = []
+        self.unmatched_gt = set()
+        self.unmatched_pred = set()
+        
+        # 룩업 사전 생성
+        gt_lookup = self.build_gt_lookup(gt_df)
+        
         pred_lookup = {}
         for path, data in pred_data.items():
             if path in ['images', 'not_parsed']:  # 특수 키 건너뛰기
                 continue
             
             image_id = self.extract_image_id_from_path(path)
-            
-            # OCR 출력에서 예측 텍스트 추출 (전체 텍스트)
-            if 'ocr' in data and 'output' in data['ocr']:
-                pred_text = str(data['ocr']['output']) if data['ocr']['output'] is not None else ""
-            else:
-                pred_text = ""
-            
-            pred_lookup[image_id] = pred_text
+            pred_lookup[image_id] = self.extract_prediction_text(data)
         
         # Ground Truth와 예측 데이터 매칭
         gt_ids = set(gt_lookup.keys())
@@ -96,11 +118,16 @@ class DataMatcher:
         self.unmatched_gt = gt_ids - pred_ids
         self.unmatched_pred = pred_ids - gt_ids
         
-        # 매칭 통계 출력
+        self.print_match_statistics(len(gt_ids), len(pred_ids), len(matched_ids))
+        
+        return self.matched_pairs
+    
+    def print_match_statistics(self, total_gt: int, total_pred: int, total_matched: int) -> None:
+        """매칭 통계 출력"""
         print(f"Matching results:")
-        print(f"  Total ground truth entries: {len(gt_ids)}")
-        print(f"  Total prediction entries: {len(pred_ids)}")
-        print(f"  Successfully matched: {len(matched_ids)}")
+        print(f"  Total ground truth entries: {total_gt}")
+        print(f"  Total prediction entries: {total_pred}")
+        print(f"  Successfully matched: {total_matched}")
         print(f"  Unmatched ground truth: {len(self.unmatched_gt)}")
         print(f"  Unmatched predictions: {len(self.unmatched_pred)}")
         
@@ -108,8 +135,6 @@ class DataMatcher:
             print(f"  Sample unmatched GT IDs: {list(self.unmatched_gt)[:5]}")
         if self.unmatched_pred:
             print(f"  Sample unmatched pred IDs: {list(self.unmatched_pred)[:5]}")
-        
-        return self.matched_pairs
     
     def get_matched_pairs(self) -> List[Tuple[str, str, str]]:
         """매칭된 (image_id, ground_truth, prediction) 쌍 얻기"""
@@ -0,0 +1,473 @@
+"""유계 큐를 사용한 로드/매칭/평가/내보내기 단계 파이프라인 실행"""
+
+import csv
+import multiprocessing
+import os
+import queue
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+import pandas as pd
+
+from .data_loader import DataLoader
+from .evaluator import BLEUEvaluator
+from .matcher import DataMatcher
+from .top_k import TopKMiner
+from ..utils.validators import validate_prediction_entry, VALIDATION_SAMPLE_SIZE
+
+
+# 파이프라인에서 지원하는 중복 정책 ('last'는 이미 평가된 쌍을 되돌려야 하므로 불가)
+PIPELINE_DUPLICATE_POLICIES = ('error', 'first')
+
+# 단계 종료 신호
+_SENTINEL = object()
+
+# 평가 프로세스마다 하나씩 생성되는 BLEU 평가기
+_process_evaluator: Optional[BLEUEvaluator] = None
+
+
+def _init_scoring_process(evaluator_factory: Callable[[], BLEUEvaluator]) -> None:
+    """평가 프로세스 초기화 - 프로세스당 BLEU 메트릭 한 번 로드"""
+    global _process_evaluator
+    _process_evaluator = evaluator_factory()
+
+
+def _score_chunk(chunk: List[Tuple[str, str, str]]) -> Tuple[List[float], float]:
+    """평가 프로세스에서 (image_id, ground_truth, prediction) 묶음의 BLEU 점수 계산"""
+    start = time.perf_counter()
+    scores = [_process_evaluator.calculate_bleu_score(prediction, ground_truth)
+              for _, ground_truth, prediction in chunk]
+    return scores, time.perf_counter() - start
+
+
+class _PipelineAborted(Exception):
+    """다른 단계의 실패로 파이프라인이 중단됨"""
+
+
+class EvaluationPipeline:
+    """
+    로드, 매칭, BLEU 평가, 내보내기 단계를 유계 큐로 연결하여 동시에 실행
+
+    샤드 읽기는 스레드에서, BLEU 평가는 GIL을 피하기 위해 별도 프로세스에서 실행된다.
+    """
+
+    def __init__(self, loader: DataLoader, matcher: DataMatcher, evaluator: BLEUEvaluator,
+                 scoring_workers: int = 1, queue_size: int = 1024,
+                 read_workers: Optional[int] = None, duplicate_policy: str = 'error',
+                 verbose: bool = True, monitor_interval: float = 0.1, chunk_size: int = 64,
+                 evaluator_factory: Callable[[], BLEUEvaluator] = BLEUEvaluator):
+        if scoring_workers < 1:
+            raise ValueError("scoring_workers must be a positive integer")
+        if queue_size < 1:
+            raise ValueError("queue_size must be a positive integer")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        if duplicate_policy not in PIPELINE_DUPLICATE_POLICIES:
+            raise ValueError(f"Unsupported duplicate policy for pipelined mode: {duplicate_policy}. "
+                             f"Expected one of {list(PIPELINE_DUPLICATE_POLICIES)}")
+
+        self.loader = loader
+        self.matcher = matcher
+        self.evaluator = evaluator
+        self.scoring_workers = scoring_workers
+        self.queue_size = queue_size
+        self.read_workers = read_workers
+        self.duplicate_policy = duplicate_policy
+        self.verbose = verbose
+        self.monitor_interval = monitor_interval
+        self.chunk_size = chunk_size
+        # 평가 프로세스에서 호출되므로 pickle 가능해야 함 (모듈 수준 클래스/함수)
+        self.evaluator_factory = evaluator_factory
+
+        self._stop = threading.Event()
+        self._errors: List[BaseException] = []
+        self._lock = threading.Lock()
+        self._stage_times: Dict[str, float] = {}
+        self._match_counts = (0, 0, 0)
+
+    def _fail(self, error: BaseException) -> None:
+        """첫 번째 오류를 기록하고 모든 단계에 중단 신호 전달"""
+        with self._lock:
+            self._errors.append(error)
+        self._stop.set()
+
+    def _add_stage_time(self, stage: str, seconds: float) -> None:
+        """단계별 작업 시간 누적 (큐 대기 시간 제외)"""
+        with self._lock:
+            self._stage_times[stage] = self._stage_times.get(stage, 0.0) + seconds
+
+    def _put(self, q: queue.Queue, item: Any) -> None:
+        """중단 신호를 확인하며 큐에 항목 추가 (큐가 가득 차면 대기 = 백프레셔)"""
+        while True:
+            if self._stop.is_set():
+                raise _PipelineAborted()
+            try:
+                q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, q: queue.Queue) -> Any:
+        """중단 신호를 확인하며 큐에서 항목 꺼내기"""
+        while True:
+            if self._stop.is_set():
+                raise _PipelineAborted()
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+    def _load_stage(self, pred_path: str, shard_queue: queue.Queue) -> None:
+        """예측 샤드를 스레드 풀로 읽어 순서대로 샤드 큐에 전달"""
+        try:
+            shard_files = self.loader.resolve_prediction_shards(pred_path)
+
+            def timed_read(shard_file):
+                start = time.perf_counter()
+                result = self.loader.read_prediction_shard(shard_file)
+                self._add_stage_time('load', time.perf_counter() - start)
+                return result
+
+            # 동시에 읽는 샤드 수를 read_workers로 제한하여 메모리 유지
+            shards = self.loader.iter_prediction_shards(shard_files, self.read_workers, timed_read)
+            try:
+                for shard_file, (entries, _) in shards:
+                    self._put(shard_queue, (shard_file, entries))
+            finally:
+                shards.close()
+
+            self._put(shard_queue, _SENTINEL)
+        except _PipelineAborted:
+            pass
+        except BaseException as e:
+            self._fail(e)
+
+    def _match_stage(self, gt_lookup: Dict[str, str], shard_queue: queue.Queue,
+                     pair_queue: queue.Queue) -> None:
+        """샤드 항목을 검증하고 Ground Truth와 매칭하여 쌍 큐에 전달"""
+        try:
+            seen_pred: Dict[str, str] = {}  # 이미지 ID -> 샤드 파일
+
+            while True:
+                item = self._get(shard_queue)
+                if item is _SENTINEL:
+                    break
+
+                shard_file, entries = item
+                start = time.perf_counter()
+                matched = []
+                for image_path, data in entries:
+                    image_id = self.matcher.extract_image_id_from_path(image_path)
+
+                    if image_id in seen_pred:
+                        if self.duplicate_policy == 'error':
+                            raise ValueError(
+                                f"Duplicate image ID '{image_id}' in {shard_file} "
+                                f"(already loaded from {seen_pred[image_id]})"
+                            )
+                        continue
+
+                    # 순차 실행의 validate_json_format과 동일하게 앞쪽 항목 구조 검증
+                    if len(seen_pred) < VALIDATION_SAMPLE_SIZE:
+                        validate_prediction_entry(image_path, data)
+                    seen_pred[image_id] = shard_file
+
+                    if image_id in gt_lookup:
+                        matched.append((image_id, gt_lookup[image_id],
+                                        self.matcher.extract_prediction_text(data)))
+                self._add_stage_time('match', time.perf_counter() - start)
+
+                for pair in matched:
+                    self._put(pair_queue, pair)
+
+            if not seen_pred:
+                raise ValueError("JSON contains no prediction entries")
+
+            # 매칭 통계 기록 (쌍 자체는 보관하지 않음)
+            gt_ids = set(gt_lookup.keys())
+            pred_ids = set(seen_pred.keys())
+            self.matcher.matched_pairs = []
+            self.matcher.unmatched_gt = gt_ids - pred_ids
+            self.matcher.unmatched_pred = pred_ids - gt_ids
+            self._match_counts = (len(gt_ids), len(pred_ids), len(gt_ids & pred_ids))
+
+            self._put(pair_queue, _SENTINEL)
+        except _PipelineAborted:
+            pass
+        except BaseException as e:
+            self._fail(e)
+
+    def _score_stage(self, pair_queue: queue.Queue, result_queue: queue.Queue) -> None:
+        """매칭된 쌍을 묶음으로 평가 프로세스에 보내고 결과를 순서대로 결과 큐에 전달"""
+        # 스레드가 실행 중인 프로세스에서 fork하지 않도록 spawn 사용
+        pool = ProcessPoolExecutor(max_workers=self.scoring_workers,
+                                   mp_context=multiprocessing.get_context('spawn'),
+                                   initializer=_init_scoring_process,
+                                   initargs=(self.evaluator_factory,))
+        # 워커당 최대 2개 묶음만 처리 중으로 유지 (백프레셔)
+        max_in_flight = 2 * self.scoring_workers
+        in_flight = deque()
+
+        def emit_oldest():
+            chunk, future = in_flight.popleft()
+            scores, seconds = future.result()
+            self._add_stage_time('score', seconds)
+            for (image_id, ground_truth, prediction), bleu_score in zip(chunk, scores):
+                self._put(result_queue, {
+                    'image_id': image_id,
+                    'ground_truth': ground_truth,
+                    'prediction': prediction,
+                    'bleu_score': bleu_score
+                })
+
+        try:
+            finished = False
+            while not finished:
+                # 첫 항목은 대기하고, 나머지는 이미 도착한 만큼만 묶음에 추가
+                chunk = []
+                item = self._get(pair_queue)
+                while item is not _SENTINEL:
+                    chunk.append(item)
+                    if len(chunk) >= self.chunk_size:
+                        break
+                    try:
+                        item = pair_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                finished = item is _SENTINEL
+
+                if chunk:
+                    if len(in_flight) >= max_in_flight:
+                        emit_oldest()
+                    in_flight.append((chunk, pool.submit(_score_chunk, chunk)))
+
+            while in_flight:
+                emit_oldest()
+
+            self._put(result_queue, _SENTINEL)
+        except _PipelineAborted:
+            pass
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _monitor_stage(self, queues: Dict[str, queue.Queue], done: threading.Event,
+                       depth_stats: Dict[str, Dict[str, float]]) -> None:
+        """큐 깊이를 주기적으로 샘플링"""
+        samples = 0
+        totals = {name: 0 for name in queues}
+        while not done.wait(self.monitor_interval):
+            samples += 1
+            for name, q in queues.items():
+                depth = q.qsize()
+                totals[name] += depth
+                depth_stats[name]['max'] = max(depth_stats[name]['max'], depth)
+
+        for name in queues:
+            depth_stats[name]['mean'] = totals[name] / samples if samples else 0.0
+
+    def run(self, gt_df: pd.DataFrame, pred_path: str, output_path: Optional[str] = None,
+            include_metadata: bool = True, top_k: int = 0, ngram_order: int = 2) -> Dict[str, Any]:
+        """
+        Run load, match, score and export stages concurrently.
+
+        The results CSV is written to a temporary file next to output_path and
+        only replaces output_path once every stage has succeeded.
+
+        Args:
+            gt_df: DataFrame with ground truth data
+            pred_path: Path to a predictions JSON/JSONL file, a shard directory or a glob pattern
+            output_path: Path to write the results CSV incrementally (optional)
+            include_metadata: Whether to include metadata columns in the CSV
+            top_k: Number of worst/best pairs to keep while scoring (0 disables)
+            ngram_order: Highest n-gram order for top-k diffs
+
+        Returns:
+            Dictionary with evaluation summary, statistics and queue depth report
+
+        Raises:
+            ValueError: If any stage fails or no pairs are matched
+        """
+        self._stop.clear()
+        self._errors = []
+        self._stage_times = {'load': 0.0, 'match': 0.0, 'score': 0.0, 'export': 0.0}
+        self._match_counts = (0, 0, 0)
+
+        gt_lookup = self.matcher.build_gt_lookup(gt_df)
+
+        # 내보내기 단계용 메타데이터 룩업
+        metadata_cols: List[str] = []
+        metadata_lookup: Dict[str, Dict[str, Any]] = {}
+        if include_metadata:
+            metadata_cols = [col for col in ['grade', 'domain_code', 'subdomain_code']
+                             if col in gt_df.columns]
+            if metadata_cols:
+                for record in gt_df[['new_custom_id'] + metadata_cols].to_dict('records'):
+                    metadata_lookup[record['new_custom_id']] = record
+
+        miner = TopKMiner(top_k, ngram_order=ngram_order) if top_k > 0 else None
+        domain_lookup = {}
+        if miner is not None and 'domain_code' in gt_df.columns:
+            for image_id, domain_code in zip(gt_df['new_custom_id'], gt_df['domain_code']):
+                if pd.notna(domain_code):
+                    domain_lookup[image_id] = str(domain_code)
+
+        shard_queue: queue.Queue = queue.Queue(maxsize=2)
+        pair_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        result_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        queues = {'shards': shard_queue, 'pairs': pair_queue, 'results': result_queue}
+        depth_stats = {name: {'max': 0, 'mean': 0.0, 'capacity': q.maxsize}
+                       for name, q in queues.items()}
+
+        threads = [
+            threading.Thread(target=self._load_stage, args=(pred_path, shard_queue),
+                             name='pipeline-load', daemon=True),
+            threading.Thread(target=self._match_stage, args=(gt_lookup, shard_queue, pair_queue),
+                             name='pipeline-match', daemon=True),
+            threading.Thread(target=self._score_stage, args=(pair_queue, result_queue),
+                             name='pipeline-score', daemon=True)
+        ]
+
+        monitor_done = threading.Event()
+        monitor = threading.Thread(target=self._monitor_stage, args=(queues, monitor_done, depth_stats),
+                                   name='pipeline-monitor', daemon=True)
+
+        if self.verbose:
+            print(f"Running pipelined evaluation with {self.scoring_workers} scoring processes, "
+                  f"queue size {self.queue_size}...")
+
+        # 성공시에만 결과 파일을 교체하도록 같은 디렉토리의 임시 파일에 기록
+        csv_file = None
+        if output_path:
+            output_dir = os.path.dirname(os.path.abspath(output_path))
+            csv_file = tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', newline='', dir=output_dir,
+                prefix=f".{os.path.basename(output_path)}.", suffix='.tmp', delete=False
+            )
+
+        start_time = time.perf_counter()
+        monitor.start()
+        for thread in threads:
+            thread.start()
+
+        # 내보내기 단계는 메인 스레드에서 실행 (결과 행은 보관하지 않음)
+        count = 0
+        total_bleu = 0.0
+        total_sq = 0.0
+        min_bleu = float('inf')
+        max_bleu = float('-inf')
+
+        succeeded = False
+        try:
+            try:
+                writer = None
+                if csv_file is not None:
+                    writer = csv.writer(csv_file)
+                    writer.writerow(['image_id', 'ground_truth', 'prediction', 'bleu_score'] + metadata_cols)
+
+                while True:
+                    item = self._get(result_queue)
+                    if item is _SENTINEL:
+                        break
+
+                    export_start = time.perf_counter()
+                    bleu_score = item['bleu_score']
+                    count += 1
+                    total_bleu += bleu_score
+                    total_sq += bleu_score * bleu_score
+                    min_bleu = min(min_bleu, bleu_score)
+                    max_bleu = max(max_bleu, bleu_score)
+
+                    if miner is not None:
+                        miner.add(item['image_id'], item['ground_truth'], item['prediction'], bleu_score,
+                                  domain_code=domain_lookup.get(item['image_id']))
+
+                    if writer is not None:
+                        metadata = metadata_lookup.get(item['image_id'], {})
+                        writer.writerow(
+                            [item['image_id'], item['ground_truth'], item['prediction'], bleu_score] +
+                            ['' if pd.isna(metadata.get(col)) else metadata.get(col) for col in metadata_cols]
+                        )
+                    self._add_stage_time('export', time.perf_counter() - export_start)
+            except _PipelineAborted:
+                pass
+            except BaseException as e:
+                self._fail(e)
+            finally:
+                for thread in threads:
+                    thread.join()
+                monitor_done.set()
+                monitor.join()
+
+            elapsed = time.perf_counter() - start_time
+
+            if self._errors:
+                error = self._errors[0]
+                if isinstance(error, (ValueError, FileNotFoundError)):
+                    raise error
+                raise ValueError(f"Pipelined evaluation failed: {error}") from error
+
+            self.matcher.print_match_statistics(*self._match_counts)
+
+            if count == 0:
+                raise ValueError("No matching pairs found between ground truth and predictions")
+
+            if csv_file is not None:
+                csv_file.close()
+                os.replace(csv_file.name, output_path)
+            succeeded = True
+        finally:
+            if csv_file is not None and not succeeded:
+                csv_file.close()
+                if os.path.exists(csv_file.name):
+                    os.unlink(csv_file.name)
+
+        mean = total_bleu / count
+        statistics = {
+            'count': count,
+            'mean': mean,
+            'min': min_bleu,
+            'max': max_bleu,
+            'std': max(total_sq / count - mean * mean, 0.0) ** 0.5
+        }
+
+        # 평가기 결과는 스트리밍 모드에서 보관하지 않음 (메모리 제한)
+        self.evaluator.results = []
+        self.evaluator.top_k_miner = miner
+
+        evaluation_summary = {
+            'average_bleu': mean,
+            'total_pairs': count,
+            'valid_scores': count,
+            'statistics': statistics,
+            'queue_depths': depth_stats,
+            'stage_times': dict(self._stage_times),
+            'elapsed': elapsed
+        }
+        if miner is not None:
+            evaluation_summary['top_k'] = miner.get_report()
+
+        print(f"Evaluation complete:")
+        print(f"  Average BLEU score: {mean:.4f}")
+        print(f"  Total pairs evaluated: {count}")
+        if output_path:
+            print(f"Results exported to {output_path}")
+
+        if self.verbose:
+            self.print_pipeline_report(evaluation_summary)
+
+        return evaluation_summary
+
+    def print_pipeline_report(self, summary: Dict[str, Any]) -> None:
+        """단계별 큐 깊이와 작업 시간 출력"""
+        print(f"Pipeline stages (wall time {summary['elapsed']:.2f}s):")
+        for stage, seconds in summary['stage_times'].items():
+            print(f"  {stage:<7} busy {seconds:.2f}s")
+        print(f"Queue depths (max / mean / capacity):")
+        for name, stats in summary['queue_depths'].items():
+            print(f"  {name:<7} {stats['max']} / {stats['mean']:.1f} / {stats['capacity']}")
@@ -0,0 +1,146 @@
+"""스트리밍 방식의 최저/최고 점수 쌍 추출 (유계 힙 기반)"""
+
+import heapq
+import itertools
+import json
+from typing import Dict, List, Any, Optional, Tuple
+
+from ..utils.ngrams import ngram_diff
+
+
+class _HeapEntry:
+    """순위 키가 가장 큰 (가장 먼저 밀려날) 항목이 루트에 오도록 역순 비교하는 힙 항목"""
+
+    __slots__ = ('rank', 'record')
+
+    def __init__(self, rank: Tuple[float, str], record: Dict[str, Any]):
+        self.rank = rank
+        self.record = record
+
+    def __lt__(self, other: '_HeapEntry') -> bool:
+        return self.rank > other.rank
+
+
+class TopKMiner:
+    """평가 중 전체 및 domain_code별 최저/최고 k개 쌍을 O(k) 메모리로 추적"""
+
+    def __init__(self, k: int, ngram_order: int = 2):
+        if k <= 0:
+            raise ValueError("k must be a positive integer")
+        if ngram_order <= 0:
+            raise ValueError("ngram_order must be a positive integer")
+
+        self.k = k
+        self.ngram_order = ngram_order
+        self._counter = itertools.count()
+        self._report: Optional[Dict[str, Any]] = None
+
+        # 각 힙은 순위 키가 작은 k개를 유지
+        # 최저 힙 순위: (score, image_id), 최고 힙 순위: (-score, image_id)
+        # 동점은 image_id로 정렬하므로 입력 순서와 무관하게 같은 결과를 얻음
+        self._worst: List[_HeapEntry] = []
+        self._best: List[_HeapEntry] = []
+        self._worst_by_domain: Dict[str, List[_HeapEntry]] = {}
+        self._best_by_domain: Dict[str, List[_HeapEntry]] = {}
+
+    def _push(self, heap: List[_HeapEntry], entry: _HeapEntry) -> None:
+        """힙 크기를 k로 유지하며 항목 추가"""
+        if len(heap) < self.k:
+            heapq.heappush(heap, entry)
+        elif entry.rank < heap[0].rank:
+            heapq.heapreplace(heap, entry)
+
+    def add(self, image_id: str, ground_truth: str, prediction: str,
+            bleu_score: float, domain_code: Optional[str] = None) -> None:
+        """
+        Offer a scored pair to the worst/best heaps.
+
+        Args:
+            image_id: Image identifier
+            ground_truth: Ground truth text
+            prediction: Prediction text
+            bleu_score: BLEU score for the pair
+            domain_code: Domain code for per-domain tracking (optional)
+        """
+        self._report = None
+
+        record = {
+            'image_id': image_id,
+            'domain_code': domain_code,
+            'bleu_score': bleu_score,
+            'ground_truth': ground_truth,
+            'prediction': prediction,
+            '_seq': next(self._counter)
+        }
+
+        worst_entry = _HeapEntry((bleu_score, str(image_id)), record)
+        best_entry = _HeapEntry((-bleu_score, str(image_id)), record)
+
+        self._push(self._worst, worst_entry)
+        self._push(self._best, best_entry)
+
+        if domain_code is not None:
+            self._push(self._worst_by_domain.setdefault(domain_code, []), worst_entry)
+            self._push(self._best_by_domain.setdefault(domain_code, []), best_entry)
+
+    def _rows(self, heap: List[_HeapEntry],
+              diff_cache: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """힙 항목을 순위대로 정렬된 리포트 행으로 변환하고 n-gram 차이 추가"""
+        rows = []
+        for entry in sorted(heap, key=lambda e: e.rank):
+            record = entry.record
+            seq = record['_seq']
+            if seq not in diff_cache:
+                diff_cache[seq] = ngram_diff(record['prediction'], record['ground_truth'],
+                                             max_n=self.ngram_order)
+            diff = diff_cache[seq]
+
+            row = {key: value for key, value in record.items() if key != '_seq'}
+            row['missing_ngrams'] = diff['missing']
+            row['extra_ngrams'] = diff['extra']
+            rows.append(row)
+        return rows
+
+    def get_report(self) -> Dict[str, Any]:
+        """
+        Build the top-k report with n-gram diffs for retained rows only.
+
+        The report is cached until the next call to add().
+
+        Returns:
+            Dictionary with 'overall' and 'by_domain' worst/best row lists
+        """
+        if self._report is not None:
+            return self._report
+
+        # 전체와 도메인 힙에 동시에 남은 행은 한 번만 diff 계산
+        diff_cache: Dict[int, Dict[str, Any]] = {}
+
+        by_domain = {}
+        for domain_code in sorted(self._worst_by_domain):
+            by_domain[domain_code] = {
+                'worst': self._rows(self._worst_by_domain[domain_code], diff_cache),
+                'best': self._rows(self._best_by_domain[domain_code], diff_cache)
+            }
+
+        self._report = {
+            'k': self.k,
+            'ngram_order': self.ngram_order,
+            'overall': {
+                'worst': self._rows(self._worst, diff_cache),
+                'best': self._rows(self._best, diff_cache)
+            },
+            'by_domain': by_domain
+        }
+        return self._report
+
+    def export_json(self, output_path: str) -> None:
+        """
+        Export the top-k report to a JSON file.
+
+        Args:
+            output_path: Path to save JSON file
+        """
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(self.get_report(), f, ensure_ascii=False, indent=2)
+        print(f"Top-k report exported to {output_path}")
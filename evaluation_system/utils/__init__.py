@@ -1,6 +1,9 @@
 """Utility functions and helpers."""
 
-from .validators import validate_csv_format, validate_json_format
+from .validators import validate_csv_format, validate_json_format, validate_prediction_entry
 from .preprocessors import clean_text, normalize_text
+from .ngrams import extract_ngrams, ngram_diff
 
-__all__ = ["validate_csv_format", "validate_json_format", "clean_text", "normalize_text"]
\ No newline at end of file
+__all__ = ["validate_csv_format", "validate_json_format", "validate_prediction_entry",
+           "clean_text", "normalize_text",
+           "extract_ngrams", "ngram_diff"]
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""n-gram 추출 및 차이 계산 유틸리티"""
+
+from collections import Counter
+from typing import Dict, List, Any
+
+from .preprocessors import normalize_text
+
+
+def extract_ngrams(tokens: List[str], n: int) -> Counter:
+    """
+    Count n-grams of a single order in a token list.
+    
+    Args:
+        tokens: Whitespace-split tokens
+        n: N-gram order
+        
+    Returns:
+        Counter mapping space-joined n-grams to their counts
+    """
+    if n <= 0 or len(tokens) < n:
+        return Counter()
+    return Counter(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+
+
+def ngram_diff(prediction: str, reference: str, max_n: int = 2) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Compute missing and extra n-grams between normalized prediction and reference.
+    
+    Args:
+        prediction: Model prediction text
+        reference: Ground truth reference text
+        max_n: Highest n-gram order to compare (orders 1..max_n)
+        
+    Returns:
+        Dictionary with 'missing' (in reference only) and 'extra' (in prediction only)
+        lists of {'ngram', 'n', 'count'} entries
+    """
+    # BLEU 계산과 동일한 정규화 적용
+    pred_tokens = normalize_text(prediction).split()
+    ref_tokens = normalize_text(reference).split()
+    
+    missing: List[Dict[str, Any]] = []
+    extra: List[Dict[str, Any]] = []
+    
+    for n in range(1, max_n + 1):
+        pred_counts = extract_ngrams(pred_tokens, n)
+        ref_counts = extract_ngrams(ref_tokens, n)
+        
+        # 다중집합 차이 (Counter 뺄셈은 양수 개수만 유지)
+        for ngram, count in (ref_counts - pred_counts).most_common():
+            missing.append({'ngram': ngram, 'n': n, 'count': count})
+        for ngram, count in (pred_counts - ref_counts).most_common():
+            extra.append({'ngram': ngram, 'n': n, 'count': count})
+    
+    return {'missing': missing, 'extra': extra}
@@ -4,6 +4,10 @@ import pandas as pd
 from typing import Dict, Any, List
 
 
+# 구조를 검사할 예측 항목 수 (앞에서부터)
+VALIDATION_SAMPLE_SIZE = 5
+
+
 def validate_csv_format(df: pd.DataFrame) -> bool:
     """
     Validate that CSV DataFrame has required format.
@@ -60,19 +64,37 @@ def validate_json_format(data: Dict[str, Any]) -> bool:
         raise ValueError("JSON contains no prediction entries")
     
     # 몇 개 항목이 필수 구조를 가지고 있는지 검증
-    sample_entries = prediction_entries[:5]  # Check first 5 entries
+    sample_entries = prediction_entries[:VALIDATION_SAMPLE_SIZE]
     for entry_key in sample_entries:
-        entry = data[entry_key]
-        if not isinstance(entry, dict):
-            raise ValueError(f"Entry {entry_key} must be a dictionary")
-        
-        if 'ocr' not in entry:
-            raise ValueError(f"Entry {entry_key} missing 'ocr' key")
+        validate_prediction_entry(entry_key, data[entry_key])
+    
+    return True
+
+
+def validate_prediction_entry(entry_key: str, entry: Any) -> bool:
+    """
+    Validate that a single prediction entry has the required structure.
+    
+    Args:
+        entry_key: Image path of the entry (used in error messages)
+        entry: Prediction entry to validate
         
-        if not isinstance(entry['ocr'], dict):
-            raise ValueError(f"Entry {entry_key} 'ocr' must be a dictionary")
+    Returns:
+        True if valid format
         
-        if 'output' not in entry['ocr']:
-            raise ValueError(f"Entry {entry_key} missing 'ocr.output' key")
+    Raises:
+        ValueError: If format is invalid
+    """
+    if not isinstance(entry, dict):
+        raise ValueError(f"Entry {entry_key} must be a dictionary")
+    
+    if 'ocr' not in entry:
+        raise ValueError(f"Entry {entry_key} missing 'ocr' key")
+    
+    if not isinstance(entry['ocr'], dict):
+        raise ValueError(f"Entry {entry_key} 'ocr' must be a dictionary")
+    
+    if 'output' not in entry['ocr']:
+        raise ValueError(f"Entry {entry_key} missing 'ocr.output' key")
     
     return True
\ No newline at end of file
@@ -6,16 +6,109 @@ Simple command-line interface for evaluating mathematical OCR models using BLEU
 """
 
 import argparse
+import glob
 import sys
 import time
 from pathlib import Path
 
-from evaluation_system.core.data_loader import DataLoader
+from evaluation_system.core.data_loader import DataLoader, DUPLICATE_POLICIES
 from evaluation_system.core.matcher import DataMatcher
 from evaluation_system.core.evaluator import BLEUEvaluator
+from evaluation_system.core.pipeline import EvaluationPipeline, PIPELINE_DUPLICATE_POLICIES
 from evaluation_system.utils.validators import validate_csv_format, validate_json_format
 
 
+def _format_ngrams(entries, limit=5):
+    """n-gram 차이 항목을 콘솔 출력용 문자열로 변환"""
+    if not entries:
+        return "-"
+    shown = [f"'{e['ngram']}'x{e['count']}" if e['count'] > 1 else f"'{e['ngram']}'"
+             for e in entries[:limit]]
+    if len(entries) > limit:
+        shown.append(f"... (+{len(entries) - limit})")
+    return ", ".join(shown)
+
+
+def print_top_k_report(report):
+    """최저/최고 top-k 리포트를 콘솔에 출력"""
+    def print_rows(title, rows):
+        print(f"  {title}:")
+        for row in rows:
+            print(f"    {row['bleu_score']:.4f}  {row['image_id']}")
+            print(f"      missing: {_format_ngrams(row['missing_ngrams'])}")
+            print(f"      extra:   {_format_ngrams(row['extra_ngrams'])}")
+    
+    print(f"\nTop-{report['k']} Worst/Best Pairs")
+    print("-" * 20)
+    print_rows("Worst (overall)", report['overall']['worst'])
+    print_rows("Best (overall)", report['overall']['best'])
+    
+    for domain_code, domain_report in report['by_domain'].items():
+        print(f"\n  [domain_code: {domain_code}]")
+        print_rows("Worst", domain_report['worst'])
+        print_rows("Best", domain_report['best'])
+
+
+def print_results_summary(results, stats):
+    """평균 점수와 요약 통계 출력"""
+    print("-" * 20)
+    print(f"Average BLEU Score: {results['average_bleu']:.4f}")
+    print(f"Total Evaluated Pairs: {results['total_pairs']}")
+    
+    # 요약 통계 출력
+    if stats:
+        print(f"Min BLEU Score: {stats['min']:.4f}")
+        print(f"Max BLEU Score: {stats['max']:.4f}")
+        print(f"Standard Deviation: {stats['std']:.4f}")
+    
+    if 'top_k' in results:
+        print_top_k_report(results['top_k'])
+
+
+def run_pipelined(args, loader, matcher, evaluator):
+    """로드/매칭/평가/내보내기 단계를 겹쳐서 실행"""
+    if not args.quiet:
+        print("\n1. Loading ground truth...")
+    
+    gt_df = loader.load_ground_truth(args.gt)
+    validate_csv_format(gt_df)
+    
+    if not args.quiet:
+        print("\n2. Running pipelined load/match/score/export...")
+    
+    include_metadata = not args.no_metadata
+    pipeline = EvaluationPipeline(
+        loader,
+        matcher,
+        evaluator,
+        scoring_workers=args.scoring_workers,
+        queue_size=args.queue_size,
+        read_workers=args.pred_workers,
+        duplicate_policy=args.duplicate_policy,
+        verbose=not args.quiet
+    )
+    results = pipeline.run(
+        gt_df,
+        args.pred,
+        output_path=args.output,
+        include_metadata=include_metadata,
+        top_k=args.top_k,
+        ngram_order=args.ngram_order
+    )
+    
+    if not args.quiet:
+        print("\n3. Results Summary")
+        print_results_summary(results, results['statistics'])
+    else:
+        # 조용한 모드 - 평균 점수만 출력
+        print(f"{results['average_bleu']:.4f}")
+    
+    if args.top_k_json:
+        if not args.quiet:
+            print(f"\nExporting top-k report to {args.top_k_json}...")
+        evaluator.export_top_k_json(args.top_k_json)
+
+
 def main():
     """평가 시스템의 메인 진입점"""
     parser = argparse.ArgumentParser(
@@ -37,7 +130,22 @@ Examples:
     parser.add_argument(
         '--pred', '--predictions',
         required=True,
-        help='Path to model predictions JSON file'
+        help='Path to model predictions JSON file, a directory of shard files, '
+             'or a glob of shard files (.json or .jsonl)'
+    )
+    
+    parser.add_argument(
+        '--pred-workers',
+        type=int,
+        default=None,
+        help='Number of threads used to read prediction shards (default: executor default)'
+    )
+    
+    parser.add_argument(
+        '--duplicate-policy',
+        choices=DUPLICATE_POLICIES,
+        default='error',
+        help='How to resolve duplicate image IDs across prediction shards (default: error)'
     )
     
     parser.add_argument(
@@ -51,6 +159,45 @@ Examples:
         help='Exclude metadata columns from output CSV'
     )
     
+    parser.add_argument(
+        '--top-k',
+        type=int,
+        default=0,
+        help='Track the k worst and k best pairs (overall and per domain_code) while scoring'
+    )
+    
+    parser.add_argument(
+        '--top-k-json',
+        help='Path to save the top-k report with n-gram diffs as JSON (requires --top-k)'
+    )
+    
+    parser.add_argument(
+        '--ngram-order',
+        type=int,
+        default=2,
+        help='Highest n-gram order used for top-k diffs (default: 2)'
+    )
+    
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Overlap load, match, score and export stages using bounded queues'
+    )
+    
+    parser.add_argument(
+        '--scoring-workers',
+        type=int,
+        default=1,
+        help='Number of BLEU scoring processes in pipelined mode (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--queue-size',
+        type=int,
+        default=1024,
+        help='Capacity of the pair and result queues in pipelined mode (default: 1024)'
+    )
+    
     parser.add_argument(
         '--quiet', '-q',
         action='store_true',
@@ -59,14 +206,41 @@ Examples:
     
     args = parser.parse_args()
     
+    if args.top_k < 0:
+        print("Error: --top-k must be a non-negative integer")
+        sys.exit(1)
+    
+    if args.ngram_order < 1:
+        print("Error: --ngram-order must be a positive integer")
+        sys.exit(1)
+    
+    if args.top_k_json and args.top_k == 0:
+        print("Error: --top-k-json requires --top-k")
+        sys.exit(1)
+    
     # 입력 파일 존재 여부 확인
     if not Path(args.gt).exists():
         print(f"Error: Ground truth file not found: {args.gt}")
         sys.exit(1)
     
-    if not Path(args.pred).exists():
+    if not Path(args.pred).exists() and not glob.glob(args.pred):
         print(f"Error: Predictions file not found: {args.pred}")
         sys.exit(1)
+    
+    if args.pred_workers is not None and args.pred_workers < 1:
+        print("Error: --pred-workers must be a positive integer")
+        sys.exit(1)
+    
+    if args.pipeline:
+        if args.scoring_workers < 1:
+            print("Error: --scoring-workers must be a positive integer")
+            sys.exit(1)
+        if args.queue_size < 1:
+            print("Error: --queue-size must be a positive integer")
+            sys.exit(1)
+        if args.duplicate_policy not in PIPELINE_DUPLICATE_POLICIES:
+            print(f"Error: --duplicate-policy {args.duplicate_policy} is not supported with --pipeline")
+            sys.exit(1)
 
 
     try:
@@ -81,12 +255,23 @@ Examples:
         matcher = DataMatcher()
         evaluator = BLEUEvaluator()
         
+        if args.pipeline:
+            run_pipelined(args, loader, matcher, evaluator)
+            elapsed_time = time.time() - start_time
+            if not args.quiet:
+                print(f"\nEvaluation completed in {elapsed_time:.2f} seconds")
+            return
+        
         # 데이터 로드
         if not args.quiet:
             print("\n1. Loading data...")
         
         gt_df = loader.load_ground_truth(args.gt)
-        pred_data = loader.load_predictions(args.pred)
+        pred_data = loader.load_predictions(
+            args.pred,
+            max_workers=args.pred_workers,
+            duplicate_policy=args.duplicate_policy
+        )
         
         # 데이터 형식 검증
         validate_csv_format(gt_df)
@@ -106,21 +291,17 @@ Examples:
         if not args.quiet:
             print("\n3. Evaluating BLEU scores...")
         
-        results = evaluator.evaluate_pairs(matched_pairs)
+        results = evaluator.evaluate_pairs(
+            matched_pairs,
+            top_k=args.top_k,
+            gt_df=gt_df,
+            ngram_order=args.ngram_order
+        )
         
         # 결과 출력
         if not args.quiet:
             print("\n4. Results Summary")
-            print("-" * 20)
-            print(f"Average BLEU Score: {results['average_bleu']:.4f}")
-            print(f"Total Evaluated Pairs: {results['total_pairs']}")
-            
-            # 요약 통계 출력
-            stats = evaluator.get_summary_statistics()
-            if stats:
-                print(f"Min BLEU Score: {stats['min']:.4f}")
-                print(f"Max BLEU Score: {stats['max']:.4f}")
-                print(f"Standard Deviation: {stats['std']:.4f}")
+            print_results_summary(results, evaluator.get_summary_statistics())
         else:
             # 조용한 모드 - 평균 점수만 출력
             print(f"{results['average_bleu']:.4f}")
@@ -137,6 +318,11 @@ Examples:
                 gt_df=gt_df if include_metadata else None
             )
         
+        if args.top_k_json:
+            if not args.quiet:
+                print(f"\nExporting top-k report to {args.top_k_json}...")
+            evaluator.export_top_k_json(args.top_k_json)
+        
         # 실행 시간 출력
         elapsed_time = time.time() - start_time
         if not args.quiet:
@@ -0,0 +1,137 @@
+"""예측 샤드 로딩 테스트"""
+
+import json
+
+import pytest
+
+from evaluation_system.core.data_loader import DataLoader
+
+
+def _write_json_shard(path, outputs):
+    data = {'images': [f"./benchmark_images/{image_id}.png" for image_id in outputs]}
+    for image_id, output in outputs.items():
+        data[f"./benchmark_images/{image_id}.png"] = {'ocr': {'output': output}}
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+
+def _write_jsonl_shard(path, records):
+    lines = [json.dumps({'image': f"./benchmark_images/{image_id}.png", 'ocr': {'output': output}})
+             for image_id, output in records]
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+
+def _outputs(data):
+    return {key.split('/')[-1][:-4]: entry['ocr']['output']
+            for key, entry in data.items() if key not in ('images', 'not_parsed')}
+
+
+@pytest.fixture
+def mixed_shards(tmp_path):
+    _write_json_shard(tmp_path / "a.json", {'img_1': 'a1', 'img_2': 'a2'})
+    _write_jsonl_shard(tmp_path / "b.jsonl", [('img_2', 'b2'), ('img_3', 'b3')])
+    (tmp_path / "notes.txt").write_text("ignored", encoding='utf-8')
+    return tmp_path
+
+
+def test_resolve_directory_filters_and_sorts(mixed_shards):
+    shards = DataLoader().resolve_prediction_shards(str(mixed_shards))
+    assert shards == [str(mixed_shards / "a.json"), str(mixed_shards / "b.jsonl")]
+
+
+def test_resolve_glob_and_single_file(mixed_shards):
+    loader = DataLoader()
+    assert loader.resolve_prediction_shards(str(mixed_shards / "*.jsonl")) == \
+        [str(mixed_shards / "b.jsonl")]
+    assert loader.resolve_prediction_shards(str(mixed_shards / "a.json")) == \
+        [str(mixed_shards / "a.json")]
+
+
+def test_resolve_without_matches(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        DataLoader().resolve_prediction_shards(str(tmp_path / "*.json"))
+
+
+def test_read_jsonl_shard(tmp_path):
+    shard = tmp_path / "s.jsonl"
+    shard.write_text('{"image": "./x/img_1.png", "ocr": {"output": "o1"}}\n\n'
+                     '{"image": "./x/img_2.png", "ocr": {"output": null}}\n', encoding='utf-8')
+    entries, not_parsed = DataLoader().read_prediction_shard(str(shard))
+    assert entries == [("./x/img_1.png", {'ocr': {'output': 'o1'}}),
+                       ("./x/img_2.png", {'ocr': {'output': None}})]
+    assert not_parsed == []
+
+
+def test_read_jsonl_shard_without_image_key(tmp_path):
+    shard = tmp_path / "s.jsonl"
+    shard.write_text('{"ocr": {"output": "o1"}}\n', encoding='utf-8')
+    with pytest.raises(ValueError, match="line 1"):
+        DataLoader().read_prediction_shard(str(shard))
+
+
+def test_load_single_jsonl_file(tmp_path):
+    shard = tmp_path / "preds.jsonl"
+    _write_jsonl_shard(shard, [('img_1', 'o1'), ('img_2', 'o2')])
+    data = DataLoader().load_predictions(str(shard))
+    assert _outputs(data) == {'img_1': 'o1', 'img_2': 'o2'}
+    assert len(data['images']) == 2
+
+
+def test_load_legacy_single_file(tmp_path):
+    shard = tmp_path / "preds.json"
+    _write_json_shard(shard, {'img_1': 'o1'})
+    data = DataLoader().load_predictions(str(shard))
+    assert _outputs(data) == {'img_1': 'o1'}
+
+
+def test_duplicate_error_policy(mixed_shards):
+    with pytest.raises(ValueError, match="Duplicate image ID 'img_2'"):
+        DataLoader().load_predictions(str(mixed_shards))
+
+
+@pytest.mark.parametrize("policy, expected", [
+    ('first', {'img_1': 'a1', 'img_2': 'a2', 'img_3': 'b3'}),
+    ('last', {'img_1': 'a1', 'img_2': 'b2', 'img_3': 'b3'}),
+])
+def test_duplicate_policies_across_mixed_shards(mixed_shards, policy, expected):
+    data = DataLoader().load_predictions(str(mixed_shards), max_workers=2, duplicate_policy=policy)
+    assert _outputs(data) == expected
+
+
+@pytest.mark.parametrize("policy, expected", [
+    ('first', {'img_1': 'x1', 'img_2': 'x2'}),
+    ('last', {'img_1': 'y1', 'img_2': 'x2'}),
+])
+def test_duplicate_within_single_jsonl_shard(tmp_path, policy, expected):
+    shard = tmp_path / "s.jsonl"
+    _write_jsonl_shard(shard, [('img_1', 'x1'), ('img_2', 'x2'), ('img_1', 'y1')])
+    data = DataLoader().load_predictions(str(shard), duplicate_policy=policy)
+    assert _outputs(data) == expected
+
+    with pytest.raises(ValueError, match="Duplicate image ID 'img_1'"):
+        DataLoader().load_predictions(str(shard))
+
+
+def test_unknown_duplicate_policy(mixed_shards):
+    with pytest.raises(ValueError, match="Unknown duplicate policy"):
+        DataLoader().load_predictions(str(mixed_shards), duplicate_policy='newest')
+
+
+def test_duplicate_error_stops_reading_remaining_shards(tmp_path, monkeypatch):
+    _write_json_shard(tmp_path / "s000.json", {'img_0': 'a'})
+    for i in range(1, 60):
+        _write_json_shard(tmp_path / f"s{i:03d}.json", {'img_0' if i == 1 else f'img_{i}': 'b'})
+
+    loader = DataLoader()
+    read_files = []
+    original_read = loader.read_prediction_shard
+
+    def counting_read(shard_file):
+        read_files.append(shard_file)
+        return original_read(shard_file)
+
+    monkeypatch.setattr(loader, 'read_prediction_shard', counting_read)
+    with pytest.raises(ValueError, match="Duplicate image ID"):
+        loader.load_predictions(str(tmp_path), max_workers=2)
+
+    # 읽기 창(max_workers) 이상으로 앞서 읽지 않음
+    assert len(read_files) <= 4
@@ -0,0 +1,155 @@
+"""파이프라인 실행 테스트 (BLEU 계산은 결정적인 스텁으로 대체)"""
+
+import json
+import threading
+
+import pandas as pd
+import pytest
+
+from evaluation_system.core.data_loader import DataLoader
+from evaluation_system.core.evaluator import BLEUEvaluator
+from evaluation_system.core.matcher import DataMatcher
+from evaluation_system.core.pipeline import EvaluationPipeline
+from evaluation_system.utils.validators import validate_json_format
+
+
+class StubEvaluator(BLEUEvaluator):
+    """evaluate 메트릭을 로드하지 않고 단어 겹침 비율을 점수로 사용"""
+
+    def __init__(self):
+        self.results = []
+        self.top_k_miner = None
+
+    def calculate_bleu_score(self, prediction: str, reference: str) -> float:
+        ref_words = set(reference.split())
+        if not ref_words:
+            return 0.0
+        return len(ref_words & set(prediction.split())) / len(ref_words)
+
+
+class FailingEvaluator(StubEvaluator):
+    """특정 예측에서 실패하는 평가기"""
+
+    def calculate_bleu_score(self, prediction: str, reference: str) -> float:
+        if prediction == "boom":
+            raise RuntimeError("boom")
+        return super().calculate_bleu_score(prediction, reference)
+
+
+def _write_gt(path, count):
+    rows = [{'new_custom_id': f"img_{i}", 'orig_q': f"q {i} x",
+             'pert_a_cleaned': f"a {i} y z", 'grade': i % 3,
+             'domain_code': "AB"[i % 2], 'subdomain_code': f"s{i % 4}"}
+            for i in range(count)]
+    pd.DataFrame(rows).to_csv(path, index=False)
+
+
+def _write_jsonl(path, outputs):
+    lines = [json.dumps({'image': f"./benchmark_images/{image_id}.png", 'ocr': {'output': output}})
+             for image_id, output in outputs]
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    _write_gt(tmp_path / "gt.csv", 40)
+    shard_dir = tmp_path / "shards"
+    shard_dir.mkdir()
+    for shard in range(4):
+        _write_jsonl(shard_dir / f"s{shard}.jsonl",
+                     [(f"img_{i}", f"q {i} a {i}" if i % 3 else "")
+                      for i in range(shard * 10, shard * 10 + 12)])
+    return tmp_path
+
+
+def _pipeline(evaluator_factory=StubEvaluator, **kwargs):
+    kwargs.setdefault('duplicate_policy', 'first')
+    return EvaluationPipeline(DataLoader(), DataMatcher(), evaluator_factory(),
+                              evaluator_factory=evaluator_factory, verbose=False, **kwargs)
+
+
+def _pipeline_threads():
+    return [t for t in threading.enumerate() if t.name.startswith('pipeline-')]
+
+
+def test_pipeline_matches_sequential(dataset):
+    loader = DataLoader()
+    gt_df = loader.load_ground_truth(str(dataset / "gt.csv"))
+    pred_data = loader.load_predictions(str(dataset / "shards"), duplicate_policy='first')
+    validate_json_format(pred_data)
+
+    evaluator = StubEvaluator()
+    sequential = evaluator.evaluate_pairs(DataMatcher().match_data(gt_df, pred_data), top_k=3, gt_df=gt_df)
+    evaluator.export_results_csv(str(dataset / "sequential.csv"), include_metadata=True, gt_df=gt_df)
+    stats = evaluator.get_summary_statistics()
+
+    pipelined = _pipeline(scoring_workers=2, chunk_size=3).run(
+        gt_df, str(dataset / "shards"), output_path=str(dataset / "pipelined.csv"), top_k=3)
+
+    assert pipelined['average_bleu'] == pytest.approx(sequential['average_bleu'])
+    assert pipelined['total_pairs'] == sequential['total_pairs']
+    for key in ('count', 'mean', 'min', 'max', 'std'):
+        assert pipelined['statistics'][key] == pytest.approx(stats[key])
+    assert pipelined['top_k'] == sequential['top_k']
+
+    sequential_df = pd.read_csv(dataset / "sequential.csv").sort_values('image_id').reset_index(drop=True)
+    pipelined_df = pd.read_csv(dataset / "pipelined.csv").sort_values('image_id').reset_index(drop=True)
+    pd.testing.assert_frame_equal(pipelined_df, sequential_df)
+
+
+def test_duplicate_error_policy_raises_without_hanging(dataset):
+    gt_df = pd.read_csv(dataset / "gt.csv")
+    outcome = {}
+
+    def run():
+        try:
+            _pipeline(duplicate_policy='error').run(gt_df, str(dataset / "shards"))
+        except ValueError as e:
+            outcome['error'] = e
+
+    runner = threading.Thread(target=run)
+    runner.start()
+    runner.join(timeout=60)
+
+    assert not runner.is_alive()
+    assert "Duplicate image ID" in str(outcome['error'])
+    assert _pipeline_threads() == []
+
+
+def test_failing_scoring_worker_stops_all_stages(dataset):
+    gt_df = pd.read_csv(dataset / "gt.csv")
+    _write_jsonl(dataset / "shards" / "r0.jsonl", [("img_5", "boom")])
+    output_path = dataset / "results.csv"
+    output_path.write_text("previous results\n", encoding='utf-8')
+
+    with pytest.raises(ValueError, match="boom"):
+        _pipeline(FailingEvaluator, queue_size=2, chunk_size=1).run(
+            gt_df, str(dataset / "shards"), output_path=str(output_path))
+
+    assert _pipeline_threads() == []
+    # 실패시 기존 결과 파일은 유지되고 임시 파일은 남지 않음
+    assert output_path.read_text(encoding='utf-8') == "previous results\n"
+    assert sorted(p.name for p in dataset.iterdir()) == ["gt.csv", "results.csv", "shards"]
+
+
+def test_invalid_entry_rejected_like_sequential(tmp_path):
+    _write_gt(tmp_path / "gt.csv", 3)
+    shard = tmp_path / "preds.jsonl"
+    shard.write_text('{"image": "./x/img_0.png", "ocr": {"text": "q 0"}}\n', encoding='utf-8')
+    gt_df = pd.read_csv(tmp_path / "gt.csv")
+
+    with pytest.raises(ValueError, match="missing 'ocr.output'"):
+        validate_json_format(DataLoader().load_predictions(str(shard)))
+
+    with pytest.raises(ValueError, match="missing 'ocr.output'"):
+        _pipeline().run(gt_df, str(shard), output_path=str(tmp_path / "out.csv"))
+    assert not (tmp_path / "out.csv").exists()
+
+
+def test_queue_depth_never_exceeds_capacity(dataset):
+    gt_df = pd.read_csv(dataset / "gt.csv")
+    summary = _pipeline(queue_size=2, chunk_size=1, monitor_interval=0.001).run(
+        gt_df, str(dataset / "shards"))
+
+    for name, stats in summary['queue_depths'].items():
+        assert 0 <= stats['max'] <= stats['capacity'], name
@@ -0,0 +1,108 @@
+"""TopKMiner 및 n-gram 차이 테스트"""
+
+import json
+import random
+
+import pytest
+
+from evaluation_system.core.top_k import TopKMiner
+from evaluation_system.utils.ngrams import extract_ngrams, ngram_diff
+
+
+def _scores(rows):
+    return [row['bleu_score'] for row in rows]
+
+
+def test_extract_ngrams_counts():
+    counts = extract_ngrams(['a', 'b', 'a', 'b'], 2)
+    assert counts == {'a b': 2, 'b a': 1}
+    assert extract_ngrams(['a'], 2) == {}
+
+
+def test_ngram_diff_multiset_counts():
+    diff = ngram_diff("x x y", "X x x x z", max_n=1)
+    assert diff['missing'] == [
+        {'ngram': 'x', 'n': 1, 'count': 2},
+        {'ngram': 'z', 'n': 1, 'count': 1}
+    ]
+    assert diff['extra'] == [{'ngram': 'y', 'n': 1, 'count': 1}]
+
+
+def test_ngram_diff_higher_orders():
+    diff = ngram_diff("a b c", "a c b", max_n=2)
+    assert diff['missing'] == [{'ngram': 'a c', 'n': 2, 'count': 1},
+                               {'ngram': 'c b', 'n': 2, 'count': 1}]
+    assert diff['extra'] == [{'ngram': 'a b', 'n': 2, 'count': 1},
+                             {'ngram': 'b c', 'n': 2, 'count': 1}]
+
+
+def test_heaps_are_bounded_and_ordered():
+    rng = random.Random(0)
+    scores = [rng.random() for _ in range(200)]
+    miner = TopKMiner(5)
+    for i, score in enumerate(scores):
+        miner.add(f"img_{i}", "ref", "pred", score)
+
+    assert len(miner._worst) == 5
+    assert len(miner._best) == 5
+
+    report = miner.get_report()
+    assert _scores(report['overall']['worst']) == sorted(scores)[:5]
+    assert _scores(report['overall']['best']) == sorted(scores, reverse=True)[:5]
+    assert report['by_domain'] == {}
+
+
+def test_per_domain_split():
+    miner = TopKMiner(2)
+    for i in range(10):
+        miner.add(f"img_{i}", "ref", "pred", i / 10, domain_code="A" if i % 2 else "B")
+
+    report = miner.get_report()
+    assert sorted(report['by_domain']) == ['A', 'B']
+    assert _scores(report['by_domain']['A']['worst']) == [0.1, 0.3]
+    assert _scores(report['by_domain']['A']['best']) == [0.9, 0.7]
+    assert _scores(report['by_domain']['B']['worst']) == [0.0, 0.2]
+    assert _scores(report['by_domain']['B']['best']) == [0.8, 0.6]
+
+
+def test_ties_are_independent_of_arrival_order():
+    ids = [f"img_{i:02d}" for i in range(20)]
+    reports = []
+    for seed in range(3):
+        shuffled = ids[:]
+        random.Random(seed).shuffle(shuffled)
+        miner = TopKMiner(3)
+        for image_id in shuffled:
+            miner.add(image_id, "ref", "", 0.0)
+        reports.append(miner.get_report())
+
+    for report in reports:
+        assert [r['image_id'] for r in report['overall']['worst']] == ids[:3]
+        assert [r['image_id'] for r in report['overall']['best']] == ids[:3]
+
+
+def test_rows_include_diffs():
+    miner = TopKMiner(1)
+    miner.add("img_0", "the cat sat", "the dog sat", 0.5)
+    row = miner.get_report()['overall']['worst'][0]
+    assert '_seq' not in row
+    assert {'ngram': 'cat', 'n': 1, 'count': 1} in row['missing_ngrams']
+    assert {'ngram': 'dog', 'n': 1, 'count': 1} in row['extra_ngrams']
+
+
+def test_report_is_cached_for_export(tmp_path, monkeypatch):
+    miner = TopKMiner(1)
+    miner.add("img_0", "a b", "a c", 0.5)
+    report = miner.get_report()
+
+    # 내보내기는 저장된 리포트를 사용하며 diff를 다시 계산하지 않음
+    monkeypatch.setattr("evaluation_system.core.top_k.ngram_diff",
+                        lambda *args, **kwargs: pytest.fail("diff recomputed"))
+    output_path = tmp_path / "top_k.json"
+    miner.export_json(str(output_path))
+    assert json.loads(output_path.read_text(encoding='utf-8')) == report
+
+
+def test_invalid_k():
+    with pytest.raises(ValueError):
+        TopKMiner(0)